@@ -1,93 +1,46 @@
 import os
+import re
 import sys
+import gzip
 import json
+import shlex
 import shutil
 import subprocess
-from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 
-class QuickSetup:
-    def __init__(self):
-        self.project_name = "autonomous-revenue-system"
-        self.files_to_create = {}
-        
-    def print_banner(self):
-        """Print setup banner"""
-        banner = """
-╔══════════════════════════════════════════════════════════════════════════════╗
-║                                                                              ║
-║  🚀💰 AUTONOMOUS REVENUE SYSTEM - ONE-CLICK SETUP 💰🚀                     ║
-║                                                                              ║
-║  Ultra-Fast Scaling • AI-Powered • $1,000+ Daily Revenue                   ║
-║                                                                              ║
-╚══════════════════════════════════════════════════════════════════════════════╝
+# Matches the deployment URL in vercel CLI output
+_VERCEL_URL_PATTERN = re.compile(r'https://\S+\.vercel\.app')
 
-        """
-        print(banner)
-        try:
-            input()
-        except KeyboardInterrupt:
-            print("\n\n❌ Setup cancelled by user")
-            sys.exit(1)
-    
-    def create_all_files(self):
-        """Create all necessary project files"""
-        print("📝 Creating project files...")
-        
-        # Define all file contents
-        self.files_to_create = {
-            # API Files
-            "api/launch.py": self.get_launch_api(),
-            "api/scaling.py": self.get_scaling_api(),
-            "api/status.py": self.get_status_api(),
-            "api/ai-learning.py": self.get_ai_learning_api(),
-            
-            # Frontend Files
-            "frontend/index.html": self.get_dashboard_html(),
-            
-            # Core Files
-            "core/__init__.py": "",
-            "core/scaling_engine.py": self.get_scaling_engine(),
-            
-            # Utils Files
-            "utils/__init__.py": "",
-            "utils/config.py": self.get_config_utils(),
-            
-            # Configuration Files
-            "vercel.json": self.get_vercel_config(),
-            "package.json": self.get_package_json(),
-            "requirements.txt": self.get_requirements(),
-            ".env.example": self.get_env_example(),
-            "README.md": self.get_readme(),
-            
-            # GitHub Workflow
-            ".github/workflows/deploy.yml": self.get_github_workflow(),
-            
-            # Deployment Script
-            "deploy.py": self.get_deploy_script()
-        }
-        
-        # Create directories and files
-        for file_path, content in self.files_to_create.items():
-            # Create directory if it doesn't exist
-            directory = os.path.dirname(file_path)
-            if directory:
-                Path(directory).mkdir(parents=True, exist_ok=True)
-            
-            # Write file content
-            with open(file_path, 'w', encoding='utf-8') as f:
-                f.write(content)
-            
-            print(f"  ✅ Created: {file_path}")
-        
-        print(f"📁 Created {len(self.files_to_create)} files")
-    
-    def get_launch_api(self):
-        """Get launch API content (simplified version)"""
-        return '''"""Vercel API endpoint for system launch"""
-import json
+# Generated file contents
+_LAUNCH_API = '''"""Vercel API endpoint for system launch"""
+try:
+    import orjson
+    _dumps = orjson.dumps
+except ImportError:
+    import json
+    _dumps = lambda obj: json.dumps(obj).encode()
 from http.server import BaseHTTPRequestHandler
 from datetime import datetime
 
+# Static parts of each response are serialized once at import;
+# only the trailing timestamp is rendered per request
+_POST_PREFIX = _dumps({
+    'status': 'success',
+    'message': 'System launched successfully',
+    'components': {
+        'ai_brain': 'active',
+        'revenue_tracker': 'active',
+        'scaling_engine': 'active'
+    }
+})[:-1] + b', "launch_time": "'
+
+_GET_PREFIX = _dumps({
+    'status': 'operational',
+    'launched': True
+})[:-1] + b', "timestamp": "'
+
+_SUFFIX = b'"}'
+
 class handler(BaseHTTPRequestHandler):
     def do_POST(self):
         self.send_response(200)
@@ -95,18 +48,7 @@ class handler(BaseHTTPRequestHandler):
         self.send_header('Access-Control-Allow-Origin', '*')
         self.end_headers()
         
-        response = {
-            'status': 'success',
-            'message': 'System launched successfully',
-            'launch_time': datetime.now().isoformat(),
-            'components': {
-                'ai_brain': 'active',
-                'revenue_tracker': 'active',
-                'scaling_engine': 'active'
-            }
-        }
-        
-        self.wfile.write(json.dumps(response).encode())
+        self.wfile.write(b''.join((_POST_PREFIX, datetime.now().isoformat().encode(), _SUFFIX)))
     
     def do_GET(self):
         self.send_response(200)
@@ -114,13 +56,7 @@ class handler(BaseHTTPRequestHandler):
         self.send_header('Access-Control-Allow-Origin', '*')
         self.end_headers()
         
-        response = {
-            'status': 'operational',
-            'launched': True,
-            'timestamp': datetime.now().isoformat()
-        }
-        
-        self.wfile.write(json.dumps(response).encode())
+        self.wfile.write(b''.join((_GET_PREFIX, datetime.now().isoformat().encode(), _SUFFIX)))
     
     def do_OPTIONS(self):
         self.send_response(200)
@@ -129,14 +65,34 @@ class handler(BaseHTTPRequestHandler):
         self.send_header('Access-Control-Allow-Headers', 'Content-Type')
         self.end_headers()
 '''
-    
-    def get_scaling_api(self):
-        """Get scaling API content (simplified version)"""
-        return '''"""Vercel API endpoint for ultra-fast scaling"""
-import json
+
+_SCALING_API = '''"""Vercel API endpoint for ultra-fast scaling"""
+try:
+    import orjson
+    _dumps = orjson.dumps
+except ImportError:
+    import json
+    _dumps = lambda obj: json.dumps(obj).encode()
 import asyncio
 from http.server import BaseHTTPRequestHandler
-from datetime import datetime
+
+# Responses are static, so serialize them once at import
+_POST_BODY = _dumps({
+    'status': 'success',
+    'scaling_candidates': 2,
+    'execution_results': {
+        'executed_actions': 3,
+        'total_investment': 750,
+        'expected_return': 2250,
+        'success_rate': 95.5
+    },
+    'execution_time': 0.8
+})
+
+_GET_BODY = _dumps({
+    'status': 'operational',
+    'scaling_engine': 'active'
+})
 
 class handler(BaseHTTPRequestHandler):
     def do_POST(self):
@@ -145,19 +101,7 @@ class handler(BaseHTTPRequestHandler):
         self.send_header('Access-Control-Allow-Origin', '*')
         self.end_headers()
         
-        response = {
-            'status': 'success',
-            'scaling_candidates': 2,
-            'execution_results': {
-                'executed_actions': 3,
-                'total_investment': 750,
-                'expected_return': 2250,
-                'success_rate': 95.5
-            },
-            'execution_time': 0.8
-        }
-        
-        self.wfile.write(json.dumps(response).encode())
+        self.wfile.write(_POST_BODY)
     
     def do_GET(self):
         self.send_response(200)
@@ -165,12 +109,7 @@ class handler(BaseHTTPRequestHandler):
         self.send_header('Access-Control-Allow-Origin', '*')
         self.end_headers()
         
-        response = {
-            'status': 'operational',
-            'scaling_engine': 'active'
-        }
-        
-        self.wfile.write(json.dumps(response).encode())
+        self.wfile.write(_GET_BODY)
     
     def do_OPTIONS(self):
         self.send_response(200)
@@ -179,14 +118,31 @@ class handler(BaseHTTPRequestHandler):
         self.send_header('Access-Control-Allow-Headers', 'Content-Type')
         self.end_headers()
 '''
-    
-    def get_status_api(self):
-        """Get status API content (simplified version)"""
-        return '''"""Vercel API endpoint for system status"""
-import json
+
+_STATUS_API = '''"""Vercel API endpoint for system status"""
+try:
+    import orjson
+    _dumps = orjson.dumps
+except ImportError:
+    import json
+    _dumps = lambda obj: json.dumps(obj).encode()
 from http.server import BaseHTTPRequestHandler
 from datetime import datetime
 
+# Static part of the response is serialized once at import;
+# only the trailing timestamp is rendered per request
+_GET_PREFIX = _dumps({
+    'status': 'operational',
+    'revenue': 1247.83,
+    'patterns_learned': 127,
+    'optimizations': 34,
+    'daily_target': 1000,
+    'success_rate': 94.5,
+    'uptime': 28472
+})[:-1] + b', "last_update": "'
+
+_SUFFIX = b'"}'
+
 class handler(BaseHTTPRequestHandler):
     def do_GET(self):
         self.send_response(200)
@@ -194,18 +150,7 @@ class handler(BaseHTTPRequestHandler):
         self.send_header('Access-Control-Allow-Origin', '*')
         self.end_headers()
         
-        response = {
-            'status': 'operational',
-            'revenue': 1247.83,
-            'patterns_learned': 127,
-            'optimizations': 34,
-            'daily_target': 1000,
-            'success_rate': 94.5,
-            'uptime': 28472,
-            'last_update': datetime.now().isoformat()
-        }
-        
-        self.wfile.write(json.dumps(response).encode())
+        self.wfile.write(b''.join((_GET_PREFIX, datetime.now().isoformat().encode(), _SUFFIX)))
     
     def do_OPTIONS(self):
         self.send_response(200)
@@ -214,13 +159,33 @@ class handler(BaseHTTPRequestHandler):
         self.send_header('Access-Control-Allow-Headers', 'Content-Type')
         self.end_headers()
 '''
-    
-    def get_ai_learning_api(self):
-        """Get AI learning API content (simplified version)"""
-        return '''"""Vercel API endpoint for AI learning system"""
-import json
+
+_AI_LEARNING_API = '''"""Vercel API endpoint for AI learning system"""
+try:
+    import orjson
+    _dumps = orjson.dumps
+except ImportError:
+    import json
+    _dumps = lambda obj: json.dumps(obj).encode()
 from http.server import BaseHTTPRequestHandler
-from datetime import datetime
+
+# Responses are static, so serialize them once at import
+_POST_BODY = _dumps({
+    'status': 'learning',
+    'patterns_discovered': 5,
+    'optimizations_generated': 3,
+    'learning_improvement': 1.2,
+    'recommendations': [
+        {'type': 'high_impact', 'message': 'Increase ad spend on high-performing campaigns'},
+        {'type': 'optimization', 'message': 'A/B test new landing page design'}
+    ]
+})
+
+_GET_BODY = _dumps({
+    'status': 'learning',
+    'patterns_learned': 156,
+    'learning_velocity': 1.3
+})
 
 class handler(BaseHTTPRequestHandler):
     def do_POST(self):
@@ -229,18 +194,7 @@ class handler(BaseHTTPRequestHandler):
         self.send_header('Access-Control-Allow-Origin', '*')
         self.end_headers()
         
-        response = {
-            'status': 'learning',
-            'patterns_discovered': 5,
-            'optimizations_generated': 3,
-            'learning_improvement': 1.2,
-            'recommendations': [
-                {'type': 'high_impact', 'message': 'Increase ad spend on high-performing campaigns'},
-                {'type': 'optimization', 'message': 'A/B test new landing page design'}
-            ]
-        }
-        
-        self.wfile.write(json.dumps(response).encode())
+        self.wfile.write(_POST_BODY)
     
     def do_GET(self):
         self.send_response(200)
@@ -248,13 +202,7 @@ class handler(BaseHTTPRequestHandler):
         self.send_header('Access-Control-Allow-Origin', '*')
         self.end_headers()
         
-        response = {
-            'status': 'learning',
-            'patterns_learned': 156,
-            'learning_velocity': 1.3
-        }
-        
-        self.wfile.write(json.dumps(response).encode())
+        self.wfile.write(_GET_BODY)
     
     def do_OPTIONS(self):
         self.send_response(200)
@@ -263,10 +211,8 @@ class handler(BaseHTTPRequestHandler):
         self.send_header('Access-Control-Allow-Headers', 'Content-Type')
         self.end_headers()
 '''
-    
-    def get_dashboard_html(self):
-        """Get simplified dashboard HTML"""
-        return '''<!DOCTYPE html>
+
+_DASHBOARD_HTML = '''<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
@@ -431,10 +377,8 @@ class handler(BaseHTTPRequestHandler):
     </script>
 </body>
 </html>'''
-    
-    def get_scaling_engine(self):
-        """Get simplified scaling engine"""
-        return '''"""Ultra-Fast Scaling Engine - Core Module"""
+
+_SCALING_ENGINE = '''"""Ultra-Fast Scaling Engine - Core Module"""
 import os
 import json
 from datetime import datetime
@@ -467,10 +411,8 @@ class UltraFastScalingEngine:
 def get_scaling_engine():
     return UltraFastScalingEngine()
 '''
-    
-    def get_config_utils(self):
-        """Get config utilities"""
-        return '''"""Configuration utilities"""
+
+_CONFIG_UTILS = '''"""Configuration utilities"""
 import os
 
 class Config:
@@ -480,10 +422,8 @@ class Config:
     EMAIL_PASS = os.getenv('EMAIL_PASS')
     AUTO_SCALING_ENABLED = os.getenv('AUTO_SCALING_ENABLED', 'true').lower() == 'true'
 '''
-    
-    def get_vercel_config(self):
-        """Get Vercel configuration"""
-        return '''{
+
+_VERCEL_CONFIG = '''{
   "version": 2,
   "name": "autonomous-revenue-system",
   "builds": [
@@ -491,14 +431,27 @@ class Config:
     { "src": "frontend/**", "use": "@vercel/static" }
   ],
   "routes": [
-    { "src": "/api/(.*)", "dest": "/api/$1" },
+    { "src": "/api/([^/]+)/?", "dest": "/api/$1/handler.py" },
+    {
+      "src": "/(index.html)?",
+      "has": [{ "type": "header", "key": "accept-encoding", "value": ".*gzip.*" }],
+      "dest": "/frontend/index.html.gz",
+      "headers": {
+        "Content-Type": "text/html; charset=utf-8",
+        "Content-Encoding": "gzip",
+        "Vary": "Accept-Encoding"
+      }
+    },
+    {
+      "src": "/(index.html)?",
+      "dest": "/frontend/index.html",
+      "headers": { "Vary": "Accept-Encoding" }
+    },
     { "src": "/(.*)", "dest": "/frontend/$1" }
   ]
 }'''
-    
-    def get_package_json(self):
-        """Get package.json"""
-        return '''{
+
+_PACKAGE_JSON = '''{
   "name": "autonomous-revenue-system",
   "version": "2.0.0",
   "description": "Ultra-fast scaling autonomous revenue system",
@@ -510,28 +463,23 @@ class Config:
   "keywords": ["revenue", "automation", "ai", "scaling"],
   "license": "MIT"
 }'''
-    
-    def get_requirements(self):
-        """Get requirements.txt"""
-        return '''# Core dependencies
+
+_REQUIREMENTS = '''# Core dependencies
 aiohttp==3.8.6
 requests==2.31.0
 python-dotenv==1.0.0
+orjson==3.10.7
 '''
-    
-    def get_env_example(self):
-        """Get .env.example"""
-        return '''# Autonomous Revenue System Configuration
+
+_ENV_EXAMPLE = '''# Autonomous Revenue System Configuration
 OPENAI_API_KEY=sk-your-openai-key-here
 EMAIL_USER=your-email@gmail.com
 EMAIL_PASS=your-app-password
 DAILY_TARGET=1000
 AUTO_SCALING_ENABLED=true
 '''
-    
-    def get_readme(self):
-        """Get README.md"""
-        return '''# 🚀 Autonomous Revenue System v2.0
+
+_README = '''# 🚀 Autonomous Revenue System v2.0
 
 **Ultra-Fast Scaling AI-Powered Revenue System**
 
@@ -561,10 +509,8 @@ AUTO_SCALING_ENABLED=true
 
 For issues and questions, check the GitHub repository.
 '''
-    
-    def get_github_workflow(self):
-        """Get GitHub Actions workflow"""
-        return '''name: Deploy to Vercel
+
+_GITHUB_WORKFLOW = '''name: Deploy to Vercel
 on:
   push:
     branches: [ main ]
@@ -579,10 +525,8 @@ jobs:
         vercel-token: ${{ secrets.VERCEL_TOKEN }}
         vercel-args: '--prod'
 '''
-    
-    def get_deploy_script(self):
-        """Get simplified deploy script"""
-        return '''#!/usr/bin/env python3
+
+_DEPLOY_SCRIPT = '''#!/usr/bin/env python3
 """Simplified deployment script"""
 import subprocess
 import sys
@@ -598,48 +542,261 @@ def deploy():
 if __name__ == "__main__":
     deploy()
 '''
+
+class QuickSetup:
+    def __init__(self):
+        self.project_name = "autonomous-revenue-system"
+        self.files_to_create = []
+        
+        # Resolve CLI tools once; None means the tool is not installed
+        self.git = shutil.which('git')
+        self.gh = shutil.which('gh')
+        self.vercel = shutil.which('vercel')
+        
+    def print_banner(self):
+        """Print setup banner"""
+        banner = """
+╔══════════════════════════════════════════════════════════════════════════════╗
+║                                                                              ║
+║  🚀💰 AUTONOMOUS REVENUE SYSTEM - ONE-CLICK SETUP 💰🚀                     ║
+║                                                                              ║
+║  Ultra-Fast Scaling • AI-Powered • $1,000+ Daily Revenue                   ║
+║                                                                              ║
+╚══════════════════════════════════════════════════════════════════════════════╝
+
+        """
+        print(banner)
+        
+        # Only wait for confirmation in interactive, non-CI runs
+        if '--yes' in sys.argv[1:] or os.environ.get('CI') or not sys.stdin.isatty():
+            return
+        
+        try:
+            input()
+        except KeyboardInterrupt:
+            print("\n\n❌ Setup cancelled by user")
+            sys.exit(1)
+    
+    def create_all_files(self):
+        """Create all necessary project files"""
+        print("📝 Creating project files...")
+        
+        # Define all files with their content builders (called only when written)
+        self.files_to_create = [
+            # API Files (one directory per endpoint)
+            ("api/launch/handler.py", self.get_launch_api),
+            ("api/scaling/handler.py", self.get_scaling_api),
+            ("api/status/handler.py", self.get_status_api),
+            ("api/ai-learning/handler.py", self.get_ai_learning_api),
+            
+            # Frontend Files
+            ("frontend/index.html", self.get_dashboard_html),
+            ("frontend/index.html.gz", self.get_dashboard_html_gzip),
+            
+            # Core Files
+            ("core/__init__.py", lambda: ""),
+            ("core/scaling_engine.py", self.get_scaling_engine),
+            
+            # Utils Files
+            ("utils/__init__.py", lambda: ""),
+            ("utils/config.py", self.get_config_utils),
+            
+            # Configuration Files
+            ("vercel.json", self.get_vercel_config),
+            ("package.json", self.get_package_json),
+            ("requirements.txt", self.get_requirements),
+            (".env.example", self.get_env_example),
+            ("README.md", self.get_readme),
+            
+            # GitHub Workflow
+            (".github/workflows/deploy.yml", self.get_github_workflow),
+            
+            # Deployment Script
+            ("deploy.py", self.get_deploy_script)
+        ]
+        
+        # Create each parent directory once, shallowest first
+        directories = {os.path.dirname(file_path) for file_path, _ in self.files_to_create
+                       if os.path.dirname(file_path)}
+        for directory in sorted(directories, key=len):
+            self.ensure_dir(directory)
+
+        # Generate and write file contents in parallel (files are independent)
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(lambda item: self.create_file(*item), self.files_to_create))
+
+        # Log once all writes are done, as a single stdout write
+        lines = [f"  ✅ Created: {file_path}" for file_path, _ in self.files_to_create]
+        lines.append(f"📁 Created {len(self.files_to_create)} files")
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
+
+    def ensure_dir(self, directory):
+        """Create a directory unless it already exists"""
+        if directory and not os.path.isdir(directory):
+            os.makedirs(directory, exist_ok=True)
+
+    def create_file(self, file_path, get_content):
+        """Build a file's content and write it to disk"""
+        content = get_content()
+        if isinstance(content, str):
+            content = content.encode('utf-8')
+        self.write_file(file_path, content)
+
+    def write_file(self, file_path, data):
+        """Write bytes to a file with raw fd writes (no fsync - files are regeneratable)"""
+        flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0)
+        fd = os.open(file_path, flags, 0o644)
+        try:
+            view = memoryview(data)
+            while view:
+                written = os.write(fd, view)
+                view = view[written:]
+        finally:
+            os.close(fd)
+    
+    def get_launch_api(self):
+        """Get launch API content (simplified version)"""
+        return _LAUNCH_API
+    
+    def get_scaling_api(self):
+        """Get scaling API content (simplified version)"""
+        return _SCALING_API
+    
+    def get_status_api(self):
+        """Get status API content (simplified version)"""
+        return _STATUS_API
+    
+    def get_ai_learning_api(self):
+        """Get AI learning API content (simplified version)"""
+        return _AI_LEARNING_API
+    
+    def get_dashboard_html(self):
+        """Get simplified dashboard HTML"""
+        return _DASHBOARD_HTML
+    
+    def get_dashboard_html_gzip(self):
+        """Get pre-compressed dashboard HTML (mtime=0 keeps the output reproducible)"""
+        return gzip.compress(_DASHBOARD_HTML.encode('utf-8'), compresslevel=9, mtime=0)
+    
+    def get_scaling_engine(self):
+        """Get simplified scaling engine"""
+        return _SCALING_ENGINE
+    
+    def get_config_utils(self):
+        """Get config utilities"""
+        return _CONFIG_UTILS
+    
+    def get_vercel_config(self):
+        """Get Vercel configuration"""
+        return _VERCEL_CONFIG
+    
+    def get_package_json(self):
+        """Get package.json"""
+        return _PACKAGE_JSON
+    
+    def get_requirements(self):
+        """Get requirements.txt"""
+        return _REQUIREMENTS
+    
+    def get_env_example(self):
+        """Get .env.example"""
+        return _ENV_EXAMPLE
+    
+    def get_readme(self):
+        """Get README.md"""
+        return _README
+    
+    def get_github_workflow(self):
+        """Get GitHub Actions workflow"""
+        return _GITHUB_WORKFLOW
+    
+    def get_deploy_script(self):
+        """Get simplified deploy script"""
+        return _DEPLOY_SCRIPT
     
     def setup_git_and_deploy(self):
         """Setup git and deploy"""
         print("\n🔄 Setting up Git repository...")
         
-        try:
-            # Initialize git
-            subprocess.run(['git', 'init'], check=True)
-            subprocess.run(['git', 'add', '.'], check=True)
-            subprocess.run(['git', 'commit', '-m', 'Initial commit: Autonomous Revenue System v2.0'], check=True)
-            print("  ✅ Git repository initialized")
-            
-            # Try to create GitHub repo (optional)
+        push_process = None
+        if not self.git:
+            print("  ⚠️  Git not found - skipping repository setup")
+        else:
             try:
-                subprocess.run(['gh', 'repo', 'create', self.project_name, '--public'], check=True)
-                subprocess.run(['git', 'remote', 'add', 'origin', f'https://github.com/your-username/{self.project_name}.git'], check=True)
-                subprocess.run(['git', 'push', '-u', 'origin', 'main'], check=True)
-                print("  ✅ GitHub repository created and pushed")
-            except:
-                print("  ⚠️  GitHub CLI not available - create repository manually")
-            
-        except Exception as e:
-            print(f"  ⚠️  Git setup failed: {e}")
+                # Initialize git
+                self.run_commands([
+                    [self.git, 'init'],
+                    # Stage exactly the files we wrote instead of scanning the working tree
+                    [self.git, 'add', '--', *(file_path for file_path, _ in self.files_to_create)],
+                    [self.git, 'commit', '-m', 'Initial commit: Autonomous Revenue System v2.0']
+                ])
+                print("  ✅ Git repository initialized")
+                
+                # Create GitHub repo (optional)
+                if not self.gh:
+                    print("  ⚠️  GitHub CLI not available - create repository manually")
+                else:
+                    try:
+                        self.run_commands([
+                            [self.gh, 'repo', 'create', self.project_name, '--public'],
+                            [self.git, 'remote', 'add', 'origin', f'https://github.com/your-username/{self.project_name}.git']
+                        ])
+                        print("  ✅ GitHub repository created")
+
+                        # Push in the background while Vercel deploys
+                        push_process = subprocess.Popen([self.git, 'push', '-u', 'origin', 'main'])
+                    except subprocess.CalledProcessError:
+                        print("  ⚠️  GitHub repository creation failed - create repository manually")
+                
+            except Exception as e:
+                print(f"  ⚠️  Git setup failed: {e}")
         
         # Deploy to Vercel
         print("\n🌐 Deploying to Vercel...")
-        try:
-            result = subprocess.run(['vercel', '--prod', '--yes'], capture_output=True, text=True)
-            if result.returncode == 0:
+        if not self.vercel:
+            print("  ❌ Vercel CLI not found")
+            print("  💡 Install Vercel CLI: npm install -g vercel")
+        else:
+            with subprocess.Popen([self.vercel, '--prod', '--yes'], stdout=subprocess.PIPE,
+                                  stderr=subprocess.STDOUT, text=True, bufsize=1) as deploy_process:
+                # Report the URL as soon as it appears, then keep draining so vercel never blocks
+                url = None
+                for line in deploy_process.stdout:
+                    match = url is None and _VERCEL_URL_PATTERN.search(line)
+                    if match:
+                        url = match.group(0)
+                        print(f"  🔗 Deployment URL: {url}")
+            
+            if deploy_process.returncode == 0:
                 print("  ✅ Deployed to Vercel successfully!")
-                
-                # Extract URL from output
-                for line in result.stdout.split('\n'):
-                    if 'https://' in line and 'vercel.app' in line:
-                        print(f"  🌐 Live URL: {line.strip()}")
-                        break
+                if url:
+                    print(f"  🌐 Live URL: {url}")
             else:
                 print("  ❌ Vercel deployment failed")
-                print("  💡 Install Vercel CLI: npm install -g vercel")
-        except FileNotFoundError:
-            print("  ❌ Vercel CLI not found")
-            print("  💡 Install Vercel CLI: npm install -g vercel")
+        
+        # Wait for the background push
+        if push_process is not None:
+            if push_process.wait() == 0:
+                print("  ✅ Pushed to GitHub")
+            else:
+                print("  ⚠️  Git push failed - push manually with: git push -u origin main")
+    
+    def run_commands(self, commands):
+        """Run commands in order in a single shell, stopping at the first failure"""
+        if os.name == 'nt':
+            # No POSIX shell on Windows - fall back to one process per command
+            for command in commands:
+                subprocess.run(command, check=True)
+            return
+        
+        # A failing step names itself on stderr and exits with its own status
+        script = '\n'.join(
+            f'{shlex.join(command)} || {{ status=$?; '
+            f'echo {shlex.quote("failed: " + shlex.join(command))} >&2; exit $status; }}'
+            for command in commands
+        )
+        subprocess.run(['sh', '-c', script], check=True)
     
     def print_completion_summary(self):
         """Print completion summary"""
@@ -650,6 +807,7 @@ if __name__ == "__main__":
 ║                                                                              ║
 ╚══════════════════════════════════════════════════════════════════════════════╝
 
+        """
         print(summary)
     
     def run_setup(self):